@@ -3,16 +3,18 @@ from __future__ import annotations
 import sys, time, csv
 from pathlib import Path
 from typing import Optional, Iterable
+import click
 
 # Monta import para src/
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 sys.path.append(str(SRC))
 
-from audio_utils import load_audio_mono, TARGET_SR
+from audio_utils import load_audio_mono, audio_duration, TARGET_SR, NoiseAugmenter
 from vosk_transcriber import VoskTranscriber
 from whisper_transcriber import WhisperTranscriber
-from benchmark import evaluate_wer  # usa a versão corrigida (jiwer v3)
+from benchmark import evaluate_wer, word_errors  # usa a versão corrigida (jiwer v3)
+from adaptive_sampling import stratified_order, AdaptiveEstimator
 
 def iter_wavs(folder: Path) -> Iterable[Path]:
     return sorted(folder.glob("*.wav"))
@@ -20,7 +22,36 @@ def iter_wavs(folder: Path) -> Iterable[Path]:
 def read_ref(txt_path: Path) -> Optional[str]:
     return txt_path.read_text(encoding="utf-8").strip() if txt_path.exists() else None
 
-def main():
+def parse_snrs(value: str) -> list[float]:
+    return [float(x) for x in value.split(",") if x.strip()]
+
+@click.command()
+@click.option("--snr", "snr_levels", default="", show_default=True,
+              help="Níveis de SNR (dB) separados por vírgula, ex.: '20,10,5,0'. Vazio = só áudio limpo.")
+@click.option("--noise", default="white", show_default=True,
+              help="Fonte de ruído: 'white', 'pink' ou caminho para banco de ruído (.npy ou float32 cru, 16 kHz).")
+@click.option("--noise_seed", type=int, default=0, show_default=True,
+              help="Semente base para offsets/ruído (reprodutível por arquivo).")
+@click.option("--adaptive", is_flag=True, default=False,
+              help="Amostragem adaptativa: ordem aleatória estratificada por duração, para quando os ICs convergem.")
+@click.option("--seed", type=int, default=0, show_default=True, help="Semente da ordem de amostragem e do bootstrap.")
+@click.option("--strata", type=int, default=4, show_default=True, help="Nº de estratos de duração.")
+@click.option("--wer_ci", type=float, default=0.02, show_default=True, help="Largura alvo do IC 95% do WER de corpus.")
+@click.option("--rtf_ci", type=float, default=0.10, show_default=True, help="Largura alvo do IC 95% do RTF (relativa ao RTF).")
+@click.option("--min_items", type=int, default=50, show_default=True, help="Mínimo de áudios antes de testar parada.")
+@click.option("--check_every", type=int, default=10, show_default=True, help="Testa parada a cada N áudios.")
+@click.option("--n_boot", type=int, default=1000, show_default=True, help="Reamostragens bootstrap.")
+def main(snr_levels: str, noise: str, noise_seed: int, adaptive: bool, seed: int, strata: int,
+         wer_ci: float, rtf_ci: float, min_items: int, check_every: int, n_boot: int):
+    """
+    Roda Vosk e Whisper sobre samples/en. Com --snr, cada áudio limpo é lido UMA vez
+    e misturado em memória com ruído em cada SNR antes de transcribe() — nenhum WAV ruidoso é gravado.
+    Com --adaptive, para assim que os ICs (bootstrap) de WER/RTF atingem a largura alvo
+    ou as engines se separam significativamente em WER.
+    """
+    snrs = parse_snrs(snr_levels)
+    augmenter = NoiseAugmenter(noise, seed=noise_seed) if snrs else None
+
     samples_en = ROOT / "samples" / "en"
     if not samples_en.exists():
         print("samples/en não encontrado. Rode prepare_librispeech_full.py antes.")
@@ -43,44 +74,90 @@ def main():
     vosk_asr = VoskTranscriber(str(vosk_model_path)) if use_vosk else None
     whisper_asr = WhisperTranscriber(model_size=whisper_size, device=whisper_device)
 
+    wavs = list(iter_wavs(samples_en))
+    estimator = None
+    stop_reason = None
+    if adaptive:
+        wavs = [wavs[i] for i in stratified_order([audio_duration(str(p)) for p in wavs], strata, seed)]
+        estimator = AdaptiveEstimator(n_boot=n_boot, seed=seed)
+        tags = [""] + [f"{s:g}" for s in snrs]
+        whisper_name = f"whisper-{whisper_size}"
+        pairs = [(("vosk", t), (whisper_name, t)) for t in tags] if vosk_asr is not None else None
+
     rows = []
     n = 0
     t0_all = time.time()
 
-    for wav_path in iter_wavs(samples_en):
+    for wav_path in wavs:
         ref = read_ref(wav_path.with_suffix(".txt"))
         audio = load_audio_mono(str(wav_path), TARGET_SR)
-
-        # Vosk
-        if vosk_asr is not None:
+        duration = max(1e-9, len(audio) / TARGET_SR)
+
+        # Versão limpa + versões ruidosas (geradas em memória, mesma passada)
+        variants = [("", audio)]
+        if augmenter is not None:
+            for snr, noisy in augmenter.augment(audio, snrs, key=wav_path.name).items():
+                variants.append((f"{snr:g}", noisy))
+
+        utt_results = {}
+        for snr_tag, audio_in in variants:
+            # Vosk
+            if vosk_asr is not None:
+                t0 = time.time()
+                out_v = vosk_asr.transcribe(audio_in)
+                elapsed_v = time.time() - t0
+                wer_v = evaluate_wer(out_v.get("text", ""), ref)
+                rows.append(["vosk", wav_path.name, snr_tag, f"{elapsed_v:.3f}", f"{elapsed_v/duration:.4f}",
+                             "" if wer_v is None else f"{wer_v:.6f}"])
+                if estimator is not None:
+                    utt_results[("vosk", snr_tag)] = (word_errors(out_v.get("text", ""), ref), elapsed_v)
+
+            # Whisper
             t0 = time.time()
-            out_v = vosk_asr.transcribe(audio)
-            elapsed_v = time.time() - t0
-            wer_v = evaluate_wer(out_v.get("text", ""), ref)
-            rows.append(["vosk", wav_path.name, f"{elapsed_v:.3f}", "" if wer_v is None else f"{wer_v:.6f}"])
-
-        # Whisper
-        t0 = time.time()
-        out_w = whisper_asr.transcribe(audio, language="en")
-        elapsed_w = time.time() - t0
-        wer_w = evaluate_wer(out_w.get("text", ""), ref)
-        rows.append([f"whisper-{whisper_size}", wav_path.name, f"{elapsed_w:.3f}", "" if wer_w is None else f"{wer_w:.6f}"])
+            out_w = whisper_asr.transcribe(audio_in, language="en")
+            elapsed_w = time.time() - t0
+            wer_w = evaluate_wer(out_w.get("text", ""), ref)
+            rows.append([f"whisper-{whisper_size}", wav_path.name, snr_tag, f"{elapsed_w:.3f}", f"{elapsed_w/duration:.4f}",
+                         "" if wer_w is None else f"{wer_w:.6f}"])
+            if estimator is not None:
+                utt_results[(f"whisper-{whisper_size}", snr_tag)] = (word_errors(out_w.get("text", ""), ref), elapsed_w)
 
         n += 1
         if n % 100 == 0:
             print(f"... processados {n} arquivos")
 
+        # Amostragem adaptativa: só entra no estimador se houver referência para todas as engines
+        if estimator is not None and all(we is not None for we, _ in utt_results.values()):
+            estimator.add(duration, {k: (we[0], we[1], el) for k, (we, el) in utt_results.items()})
+            m = len(estimator)
+            if m >= min_items and m % check_every == 0:
+                stop_reason = estimator.should_stop(wer_ci, rtf_ci, pairs)
+                if stop_reason:
+                    print(f"... parada adaptativa após {n} arquivos ({stop_reason})")
+                    break
+
     total_elapsed = time.time() - t0_all
 
     # Grava CSV
     with open(out_csv, "w", newline="", encoding="utf-8") as f:
         wr = csv.writer(f)
-        wr.writerow(["engine", "file", "elapsed_s", "wer"])
+        wr.writerow(["engine", "file", "snr_db", "elapsed_s", "rtf", "wer"])
         wr.writerows(rows)
 
     print(f"✔ Benchmark salvo em: {out_csv}")
     print(f"Total áudios: {n} | Tempo total: {total_elapsed/60:.1f} min")
 
+    if estimator is not None:
+        print(f"\n=== AMOSTRAGEM ADAPTATIVA ({n}/{len(wavs)} áudios, parada: {stop_reason or 'fim dos dados'}) ===")
+        for (eng, snr_tag), st in estimator.summary().items():
+            print(f"{eng:16s}  snr={snr_tag or 'clean':>5s}  "
+                  f"WER={st['wer']:.3f} [{st['wer_lo']:.3f}, {st['wer_hi']:.3f}]  "
+                  f"RTF={st['rtf']:.3f} [{st['rtf_lo']:.3f}, {st['rtf_hi']:.3f}]")
+        for a, b in pairs or []:
+            if len(estimator):
+                d = estimator.difference(a, b)
+                print(f"Δ WER {a[0]} - {b[0]} (snr={a[1] or 'clean'}): [{d['wer_lo']:+.3f}, {d['wer_hi']:+.3f}]")
+
     # Sumário simples (médias)
     def mean(vals):
         vals = [float(x) for x in vals]
@@ -89,23 +166,26 @@ def main():
     import statistics
     from collections import defaultdict
 
-    buckets = defaultdict(lambda: {"elapsed": [], "wer": []})
-    for eng, _, elapsed, wer in rows:
+    buckets = defaultdict(lambda: {"elapsed": [], "rtf": [], "wer": []})
+    for eng, _, snr_tag, elapsed, rtf, wer in rows:
         try:
-            buckets[eng]["elapsed"].append(float(elapsed))
+            key = (eng, snr_tag or "clean")
+            buckets[key]["elapsed"].append(float(elapsed))
+            buckets[key]["rtf"].append(float(rtf))
             if wer != "":
-                buckets[eng]["wer"].append(float(wer))
+                buckets[key]["wer"].append(float(wer))
         except:
             pass
 
-    print("\n=== MÉDIAS POR ENGINE ===")
-    for eng, data in buckets.items():
+    print("\n=== MÉDIAS POR ENGINE / SNR (dB) ===")
+    for (eng, snr_tag), data in buckets.items():
         m_t = mean(data["elapsed"]) if data["elapsed"] else 0.0
+        m_r = mean(data["rtf"]) if data["rtf"] else 0.0
         m_w = mean(data["wer"]) if data["wer"] else None
         if m_w is None:
-            print(f"{eng:16s}  elapsed_avg={m_t:.3f}s  wer_avg=–")
+            print(f"{eng:16s}  snr={snr_tag:>5s}  elapsed_avg={m_t:.3f}s  rtf_avg={m_r:.3f}  wer_avg=–")
         else:
-            print(f"{eng:16s}  elapsed_avg={m_t:.3f}s  wer_avg={m_w:.3f}")
+            print(f"{eng:16s}  snr={snr_tag:>5s}  elapsed_avg={m_t:.3f}s  rtf_avg={m_r:.3f}  wer_avg={m_w:.3f}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,125 @@
+# scripts/benchmark_kws_en.py
+from __future__ import annotations
+import sys, time, csv
+from collections import Counter
+from pathlib import Path
+from typing import Optional, Iterable, Dict, List
+import click
+
+# Monta import para src/
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.append(str(SRC))
+
+from audio_utils import load_audio_mono, TARGET_SR
+from vosk_transcriber import VoskTranscriber
+from whisper_transcriber import WhisperTranscriber
+from keyword_index import KeywordIndex, normalize_words
+
+def iter_wavs(folder: Path) -> Iterable[Path]:
+    return sorted(folder.glob("*.wav"))
+
+def read_ref(txt_path: Path) -> Optional[str]:
+    return txt_path.read_text(encoding="utf-8").strip() if txt_path.exists() else None
+
+def pick_keywords(refs: List[str], n: int, min_len: int = 5) -> List[str]:
+    """Palavras mais frequentes nas referências (>= min_len letras), para ter positivos suficientes."""
+    counts = Counter(w for ref in refs for w in normalize_words(ref) if len(w) >= min_len)
+    return [w for w, _ in counts.most_common(n)]
+
+def score(pred: Dict[str, int], truth: Dict[str, int]):
+    """TP/FP/FN por contagem de ocorrências de cada keyword."""
+    tp = sum(min(pred[k], truth[k]) for k in truth)
+    fp = sum(pred[k] for k in truth) - tp
+    fn = sum(truth.values()) - tp
+    return tp, fp, fn
+
+@click.command()
+@click.option("--keywords", default="", help="Keywords separadas por vírgula. Vazio = escolhe automaticamente das referências.")
+@click.option("--n_keywords", type=int, default=20, show_default=True, help="Qtd. de keywords automáticas.")
+@click.option("--whisper_size", default="base", show_default=True,
+              type=click.Choice(["tiny", "base", "small", "medium", "large"]))
+@click.option("--whisper_device", default="cpu", show_default=True, help="'cpu' ou 'cuda'.")
+@click.option("--skip_whisper", is_flag=True, default=False, help="Compara só Vosk KWS vs Vosk completo.")
+def main(keywords: str, n_keywords: int, whisper_size: str, whisper_device: str, skip_whisper: bool):
+    """
+    Compara detecção de palavras-chave:
+      - vosk-kws       : KaldiRecognizer com gramática restrita às keywords;
+      - vosk+index     : decodificação completa + busca Aho-Corasick no texto;
+      - whisper+index  : idem, com Whisper.
+    Reporta precisão/recall (por ocorrência) e throughput (RTF, x tempo real).
+    """
+    samples_en = ROOT / "samples" / "en"
+    vosk_model_path = ROOT / "models" / "vosk-en"
+    if not samples_en.exists() or not vosk_model_path.exists():
+        print("samples/en ou models/vosk-en não encontrado. Rode prepare_librispeech_full.py e get_models.py antes.")
+        return
+
+    results_dir = ROOT / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    out_csv = results_dir / "kws_en.csv"
+
+    files = [(p, read_ref(p.with_suffix(".txt"))) for p in iter_wavs(samples_en)]
+    files = [(p, ref) for p, ref in files if ref]
+    kw_list = [k.strip() for k in keywords.split(",") if k.strip()] or pick_keywords([r for _, r in files], n_keywords)
+    index = KeywordIndex(kw_list)
+    print(f"Keywords ({len(index.keywords)}): {', '.join(index.keywords)}")
+
+    vosk_asr = VoskTranscriber(str(vosk_model_path))
+    whisper_asr = None if skip_whisper else WhisperTranscriber(model_size=whisper_size, device=whisper_device)
+
+    rows = []
+    totals = {}  # method -> [tp, fp, fn, elapsed, audio_s]
+
+    def add(method: str, name: str, pred: Dict[str, int], truth: Dict[str, int], elapsed: float, duration: float):
+        tp, fp, fn = score(pred, truth)
+        rows.append([method, name, f"{elapsed:.3f}", f"{elapsed/duration:.4f}", tp, fp, fn])
+        t = totals.setdefault(method, [0, 0, 0, 0.0, 0.0])
+        for i, v in enumerate((tp, fp, fn, elapsed, duration)):
+            t[i] += v
+
+    def counts_of(detections) -> Dict[str, int]:
+        c = {kw: 0 for kw in index.keywords}
+        for d in detections:
+            c[d["keyword"]] += 1
+        return c
+
+    for wav_path, ref in files:
+        audio = load_audio_mono(str(wav_path), TARGET_SR)
+        duration = max(1e-9, len(audio) / TARGET_SR)
+        truth = index.count(ref)
+
+        # Vosk com gramática restrita
+        t0 = time.time()
+        out_k = vosk_asr.spot_keywords(audio, index.keywords)
+        add("vosk-kws", wav_path.name, counts_of(out_k["detections"]), truth, time.time() - t0, duration)
+
+        # Vosk completo + busca no índice
+        t0 = time.time()
+        out_v = vosk_asr.transcribe(audio)
+        pred_v = counts_of(index.search_segments(out_v["segments"]))
+        add("vosk+index", wav_path.name, pred_v, truth, time.time() - t0, duration)
+
+        # Whisper completo + busca no índice
+        if whisper_asr is not None:
+            t0 = time.time()
+            out_w = whisper_asr.transcribe(audio, language="en")
+            pred_w = counts_of(index.search_segments(out_w["segments"]))
+            add(f"whisper-{whisper_size}+index", wav_path.name, pred_w, truth, time.time() - t0, duration)
+
+    with open(out_csv, "w", newline="", encoding="utf-8") as f:
+        wr = csv.writer(f)
+        wr.writerow(["method", "file", "elapsed_s", "rtf", "tp", "fp", "fn"])
+        wr.writerows(rows)
+
+    print(f"✔ Resultados salvos em: {out_csv}")
+    print("\n=== KWS: PRECISÃO / RECALL / THROUGHPUT ===")
+    for method, (tp, fp, fn, elapsed, audio_s) in totals.items():
+        prec = tp / (tp + fp) if tp + fp else 0.0
+        rec = tp / (tp + fn) if tp + fn else 0.0
+        rtf = elapsed / audio_s if audio_s else 0.0
+        xrt = audio_s / elapsed if elapsed else 0.0
+        print(f"{method:22s}  precision={prec:.3f}  recall={rec:.3f}  rtf={rtf:.3f}  speed={xrt:.1f}x tempo real")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# scripts/benchmark_whisper_sweep_en.py
+from __future__ import annotations
+import sys, time, csv
+from pathlib import Path
+from typing import Optional, Iterable
+import click
+
+# Monta import para src/
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.append(str(SRC))
+
+from audio_utils import load_audio_mono, TARGET_SR
+from whisper_transcriber import WhisperTranscriber
+from benchmark import evaluate_wer
+
+# Configurações de decodificação comparadas (só o decoder muda entre elas)
+SWEEP = [
+    ("lang=en greedy",   {"language": "en"}),
+    ("lang=auto greedy", {"language": None}),
+    ("lang=en beam=5",   {"language": "en", "beam_size": 5}),
+    ("lang=en t=0",      {"language": "en", "temperature": 0.0}),
+    ("task=translate",   {"language": "en", "task": "translate"}),
+]
+
+def iter_wavs(folder: Path) -> Iterable[Path]:
+    return sorted(folder.glob("*.wav"))
+
+def read_ref(txt_path: Path) -> Optional[str]:
+    return txt_path.read_text(encoding="utf-8").strip() if txt_path.exists() else None
+
+@click.command()
+@click.option("--whisper_size", default="base", show_default=True,
+              type=click.Choice(["tiny", "base", "small", "medium", "large"]))
+@click.option("--whisper_device", default="cpu", show_default=True, help="'cpu' ou 'cuda'.")
+@click.option("--max_items", type=int, default=20, show_default=True, help="Qtd. de áudios de samples/en.")
+@click.option("--cache_size", type=int, default=64, show_default=True, help="Itens no LRU de mel/encoder.")
+@click.option("--cache_dir", type=click.Path(file_okay=False, path_type=Path), default=None,
+              help="Diretório opcional para gravar as saídas do encoder em disco.")
+def main(whisper_size: str, whisper_device: str, max_items: int, cache_size: int, cache_dir: Optional[Path]):
+    """
+    Varre várias configurações de decodificação do Whisper sobre os mesmos áudios,
+    com e sem cache de mel/encoder, e mostra o ganho de tempo (o texto deve ser idêntico).
+    """
+    samples_en = ROOT / "samples" / "en"
+    if not samples_en.exists():
+        print("samples/en não encontrado. Rode prepare_librispeech_full.py antes.")
+        return
+
+    results_dir = ROOT / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    out_csv = results_dir / "whisper_sweep_en.csv"
+
+    plain = WhisperTranscriber(model_size=whisper_size, device=whisper_device)
+    cached = WhisperTranscriber(model_size=whisper_size, device=whisper_device, cache_size=cache_size,
+                                cache_dir=str(cache_dir) if cache_dir else None)
+
+    rows = []
+    totals = {"plain": 0.0, "cached": 0.0}
+    mismatches = 0
+    wavs = list(iter_wavs(samples_en))[:max_items]
+
+    for wav_path in wavs:
+        ref = read_ref(wav_path.with_suffix(".txt"))
+        audio = load_audio_mono(str(wav_path), TARGET_SR)
+
+        for name, opts in SWEEP:
+            t0 = time.time()
+            out_p = plain.transcribe(audio, **opts)
+            elapsed_p = time.time() - t0
+
+            t0 = time.time()
+            out_c = cached.transcribe(audio, **opts)
+            elapsed_c = time.time() - t0
+
+            totals["plain"] += elapsed_p
+            totals["cached"] += elapsed_c
+            mismatches += out_p["text"] != out_c["text"]
+            wer = evaluate_wer(out_c.get("text", ""), ref)
+            rows.append([name, wav_path.name, f"{elapsed_p:.3f}", f"{elapsed_c:.3f}",
+                         "" if wer is None else f"{wer:.6f}"])
+
+    with open(out_csv, "w", newline="", encoding="utf-8") as f:
+        wr = csv.writer(f)
+        wr.writerow(["setting", "file", "elapsed_plain_s", "elapsed_cached_s", "wer"])
+        wr.writerows(rows)
+
+    print(f"✔ Resultados salvos em: {out_csv}")
+    print(f"\n=== SWEEP whisper-{whisper_size}: {len(SWEEP)} configurações × {len(wavs)} áudios ===")
+    for name, _ in SWEEP:
+        sel = [r for r in rows if r[0] == name]
+        wers = [float(r[4]) for r in sel if r[4] != ""]
+        m_p = sum(float(r[2]) for r in sel) / max(1, len(sel))
+        m_c = sum(float(r[3]) for r in sel) / max(1, len(sel))
+        m_w = f"{sum(wers)/len(wers):.3f}" if wers else "–"
+        print(f"{name:18s}  plain_avg={m_p:.3f}s  cached_avg={m_c:.3f}s  wer_avg={m_w}")
+    speedup = totals["plain"] / totals["cached"] if totals["cached"] else 0.0
+    print(f"\nTempo total: sem cache={totals['plain']:.1f}s | com cache={totals['cached']:.1f}s | speedup={speedup:.2f}x")
+    print(f"Cache: {cached.cache_stats()} | transcrições divergentes: {mismatches}")
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,21 @@ df = pd.read_csv(csv_path)
 # Converte colunas numéricas
 df["elapsed_s"] = pd.to_numeric(df["elapsed_s"], errors="coerce")
 df["wer"] = pd.to_numeric(df["wer"], errors="coerce")
+if "rtf" in df.columns:
+    df["rtf"] = pd.to_numeric(df["rtf"], errors="coerce")
+if "snr_db" in df.columns:
+    df["snr_db"] = df["snr_db"].fillna("clean").astype(str)
+    noisy = df[df["snr_db"] != "clean"]
+    df_clean = df[df["snr_db"] == "clean"]
+else:
+    noisy = df.iloc[0:0]
+    df_clean = df
 
 print("=== Estatísticas de Benchmark ===\n")
 
+df_all = df
+df = df_clean
+
 print("→ Amostras por engine:")
 print(df["engine"].value_counts(), "\n")
 
@@ -23,3 +35,7 @@ print(df_w.groupby("engine")["wer"].mean(), "\n")
 
 print("→ WER por engine (estatísticas detalhadas):")
 print(df_w.groupby("engine")["wer"].describe(), "\n")
+
+if len(noisy):
+    print("→ WER / RTF médios por engine e SNR (dB):")
+    print(df_all.groupby(["engine", "snr_db"])[["wer", "rtf"]].mean(), "\n")
@@ -0,0 +1,123 @@
+# src/adaptive_sampling.py
+from __future__ import annotations
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+import numpy as np
+
+def stratified_order(durations: Sequence[float], n_strata: int = 4, seed: int = 0) -> List[int]:
+    """
+    Seeded random order whose every prefix is roughly duration-stratified:
+    items are split into duration quantile strata, shuffled inside each
+    stratum, then interleaved in proportion to stratum size.
+    """
+    durations = np.asarray(durations, dtype=np.float64)
+    n = len(durations)
+    if n == 0:
+        return []
+    rng = np.random.default_rng(seed)
+    n_strata = max(1, min(n_strata, n))
+    ranks = np.argsort(np.argsort(durations, kind="stable"), kind="stable")
+    strata = (ranks * n_strata) // n
+    buckets = [rng.permutation(np.flatnonzero(strata == s)) for s in range(n_strata)]
+    # position of each item inside its stratum, scaled to [0, 1): merging on it interleaves strata
+    keys = np.empty(n, dtype=np.float64)
+    for b in buckets:
+        keys[b] = (np.arange(len(b)) + rng.random(len(b))) / len(b)
+    return [int(i) for i in np.argsort(keys, kind="stable")]
+
+class AdaptiveEstimator:
+    """
+    Running corpus WER (sum of errors / sum of reference words) and RTF
+    (sum of elapsed / sum of audio seconds) per key, with bootstrap CIs.
+    Every key must be updated once per utterance so that resamples are paired
+    across keys (engines are compared on the same utterances).
+    """
+
+    def __init__(self, n_boot: int = 1000, alpha: float = 0.05, seed: int = 0):
+        self.n_boot = n_boot
+        self.alpha = alpha
+        self.seed = seed
+        self.durations: List[float] = []
+        self.data: Dict[Hashable, Dict[str, List[float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    def add(self, duration: float, results: Dict[Hashable, Tuple[int, int, float]]):
+        """results: key -> (word_errors, ref_words, elapsed_s) for one utterance."""
+        self.durations.append(duration)
+        for key, (errors, words, elapsed) in results.items():
+            d = self.data.setdefault(key, {"errors": [], "words": [], "elapsed": []})
+            d["errors"].append(errors)
+            d["words"].append(words)
+            d["elapsed"].append(elapsed)
+
+    def _resample_idx(self) -> np.ndarray:
+        # same seed for every call -> same resamples for every key (paired bootstrap)
+        rng = np.random.default_rng(self.seed + len(self))
+        n = len(self)
+        return rng.integers(0, n, size=(self.n_boot, n))
+
+    def _boot(self, key: Hashable, idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        d = self.data[key]
+        errors = np.asarray(d["errors"], dtype=np.float64)
+        words = np.asarray(d["words"], dtype=np.float64)
+        elapsed = np.asarray(d["elapsed"], dtype=np.float64)
+        durations = np.asarray(self.durations, dtype=np.float64)
+        wer = errors[idx].sum(axis=1) / np.maximum(1.0, words[idx].sum(axis=1))
+        rtf = elapsed[idx].sum(axis=1) / np.maximum(1e-9, durations[idx].sum(axis=1))
+        return wer, rtf
+
+    def _ci(self, samples: np.ndarray) -> Tuple[float, float]:
+        lo, hi = np.quantile(samples, [self.alpha / 2, 1 - self.alpha / 2])
+        return float(lo), float(hi)
+
+    def summary(self) -> Dict[Hashable, Dict[str, float]]:
+        """Point estimates and CIs per key: wer, wer_lo, wer_hi, rtf, rtf_lo, rtf_hi."""
+        if not len(self):
+            return {}
+        idx = self._resample_idx()
+        out = {}
+        for key, d in self.data.items():
+            wer_b, rtf_b = self._boot(key, idx)
+            wer_lo, wer_hi = self._ci(wer_b)
+            rtf_lo, rtf_hi = self._ci(rtf_b)
+            out[key] = {
+                "wer": sum(d["errors"]) / max(1.0, sum(d["words"])),
+                "wer_lo": wer_lo, "wer_hi": wer_hi,
+                "rtf": sum(d["elapsed"]) / max(1e-9, sum(self.durations)),
+                "rtf_lo": rtf_lo, "rtf_hi": rtf_hi,
+            }
+        return out
+
+    def difference(self, a: Hashable, b: Hashable) -> Dict[str, float]:
+        """Paired bootstrap CI of WER(a) - WER(b) and RTF(a) - RTF(b)."""
+        idx = self._resample_idx()
+        wer_a, rtf_a = self._boot(a, idx)
+        wer_b, rtf_b = self._boot(b, idx)
+        wer_lo, wer_hi = self._ci(wer_a - wer_b)
+        rtf_lo, rtf_hi = self._ci(rtf_a - rtf_b)
+        return {"wer_lo": wer_lo, "wer_hi": wer_hi, "rtf_lo": rtf_lo, "rtf_hi": rtf_hi}
+
+    def should_stop(self, wer_width: float, rtf_rel_width: float,
+                    pairs: Optional[Sequence[Tuple[Hashable, Hashable]]] = None) -> Optional[str]:
+        """
+        Returns the stop reason, or None to keep sampling:
+          'converged' - every WER CI is narrower than wer_width and every RTF CI
+                        narrower than rtf_rel_width * RTF;
+          'separated' - every pair's WER difference CI excludes zero.
+        """
+        summ = self.summary()
+        if not summ:
+            return None
+        converged = all(
+            (s["wer_hi"] - s["wer_lo"]) <= wer_width
+            and (s["rtf_hi"] - s["rtf_lo"]) <= rtf_rel_width * max(1e-9, s["rtf"])
+            for s in summ.values()
+        )
+        if converged:
+            return "converged"
+        if pairs:
+            diffs = [self.difference(a, b) for a, b in pairs]
+            if all(d["wer_lo"] > 0 or d["wer_hi"] < 0 for d in diffs):
+                return "separated"
+        return None
@@ -1,6 +1,8 @@
 # src/audio_utils.py
 from __future__ import annotations
 import os
+import zlib
+from typing import Dict, Optional, Sequence
 import numpy as np
 import soundfile as sf
 import resampy
@@ -20,6 +22,10 @@ def load_audio_mono(path: str, target_sr: int = TARGET_SR) -> np.ndarray:
     maxv = max(1e-9, np.max(np.abs(audio)))
     return (audio / maxv) * 0.95
 
+def audio_duration(path: str) -> float:
+    """Duration in seconds from the file header (no decoding)."""
+    return float(sf.info(path).duration)
+
 def write_wav(path: str, audio: np.ndarray, sr: int = TARGET_SR):
     sf.write(path, audio, sr)
 
@@ -38,3 +44,90 @@ def chunk_audio(audio: np.ndarray, sr: int = TARGET_SR, chunk_sec: float = 15.0,
         if end == n:
             break
         start += hop
+
+# ---------------------------------------------------------------------------
+# Noise augmentation (in memory, no files written)
+# ---------------------------------------------------------------------------
+
+NOISE_KINDS = ["white", "pink"]
+
+def _stable_seed(seed: int, key: str) -> int:
+    """Derive a per-utterance seed that does not depend on iteration order."""
+    return zlib.crc32(f"{seed}:{key}".encode("utf-8"))
+
+def synth_noise(n: int, kind: str = "white", rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Generate n samples of synthetic noise ('white' or 'pink'), float32, unit RMS."""
+    assert kind in NOISE_KINDS, f"kind must be one of {NOISE_KINDS}"
+    rng = rng if rng is not None else np.random.default_rng()
+    noise = rng.standard_normal(n)
+    if kind == "pink":
+        # 1/f shaping in the frequency domain
+        spec = np.fft.rfft(noise)
+        freqs = np.arange(len(spec), dtype=np.float64)
+        freqs[0] = 1.0
+        noise = np.fft.irfft(spec / np.sqrt(freqs), n=n)
+    rms = max(1e-12, float(np.sqrt(np.mean(noise ** 2))))
+    return (noise / rms).astype(np.float32)
+
+def load_noise_bank(path: str) -> np.ndarray:
+    """
+    Open a noise bank as a read-only memory map.
+    Accepts a 1-D .npy array (any float dtype) or raw float32 samples (.f32/.raw),
+    both at TARGET_SR. Only the slices actually used are paged in.
+    """
+    if path.endswith(".npy"):
+        bank = np.load(path, mmap_mode="r")
+    else:
+        bank = np.memmap(path, dtype=np.float32, mode="r")
+    if bank.ndim != 1:
+        raise ValueError(f"noise bank must be 1-D, got shape {bank.shape}")
+    return bank
+
+def mix_at_snr(clean: np.ndarray, noise: np.ndarray, snr_db: Sequence[float]) -> np.ndarray:
+    """
+    Mix one noise segment into clean audio at every SNR in snr_db at once.
+    Returns an array of shape (len(snr_db), len(clean)), peak-normalized to 0.95
+    like load_audio_mono.
+    """
+    snr = np.asarray(snr_db, dtype=np.float64)
+    p_clean = float(np.mean(clean.astype(np.float64) ** 2))
+    p_noise = max(1e-12, float(np.mean(noise.astype(np.float64) ** 2)))
+    gains = np.sqrt(p_clean / (p_noise * 10.0 ** (snr / 10.0)))
+    mixed = clean[None, :] + gains[:, None] * noise[None, :]
+    peaks = np.maximum(1e-9, np.max(np.abs(mixed), axis=1, keepdims=True))
+    return ((mixed / peaks) * 0.95).astype(np.float32)
+
+class NoiseAugmenter:
+    def __init__(self, noise: str = "white", seed: int = 0):
+        """
+        noise: 'white', 'pink' or path to a noise bank (see load_noise_bank)
+        seed: base seed; each utterance derives its own from (seed, key)
+        """
+        self.seed = seed
+        if noise in NOISE_KINDS:
+            self.kind = noise
+            self.bank = None
+        else:
+            self.kind = os.path.basename(noise)
+            self.bank = load_noise_bank(noise)
+
+    def noise_for(self, n: int, key: str) -> np.ndarray:
+        """Reproducible noise segment of n samples for utterance 'key'."""
+        rng = np.random.default_rng(_stable_seed(self.seed, key))
+        if self.bank is None:
+            return synth_noise(n, self.kind, rng)
+        total = len(self.bank)
+        if total >= n:
+            offset = int(rng.integers(0, total - n + 1))
+            return np.asarray(self.bank[offset:offset + n], dtype=np.float32)
+        # bank shorter than the utterance: wrap around from a random offset
+        offset = int(rng.integers(0, total))
+        idx = (offset + np.arange(n)) % total
+        return np.asarray(self.bank[idx], dtype=np.float32)
+
+    def augment(self, audio: np.ndarray, snr_db: Sequence[float], key: str) -> Dict[float, np.ndarray]:
+        """Return {snr_db: noisy_audio}; the same noise segment is used for every SNR."""
+        if not len(snr_db):
+            return {}
+        mixed = mix_at_snr(audio, self.noise_for(len(audio), key), snr_db)
+        return {float(s): mixed[i] for i, s in enumerate(snr_db)}
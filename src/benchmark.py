@@ -2,7 +2,7 @@
 from __future__ import annotations
 import time
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import numpy as np
 import jiwer
 from audio_utils import load_audio_mono, TARGET_SR
@@ -19,17 +19,20 @@ class ASRBenchmarkResult:
 
 # Substitua a função evaluate_wer existente por esta:
 
-def evaluate_wer(hyp: str, ref: Optional[str]) -> Optional[float]:
-    if not ref:
-        return None
+def _wer_transform():
     # Normalizações idênticas para truth e hypothesis
-    transformation = jiwer.Compose([
+    return jiwer.Compose([
         jiwer.ToLowerCase(),
         jiwer.RemoveMultipleSpaces(),
         jiwer.Strip(),
         jiwer.RemovePunctuation(),         # remove vírgulas/pontos/apóstrofos
         jiwer.ReduceToListOfListOfWords()  # tokeniza em palavras
     ])
+
+def evaluate_wer(hyp: str, ref: Optional[str]) -> Optional[float]:
+    if not ref:
+        return None
+    transformation = _wer_transform()
     try:
         return float(jiwer.wer(
             ref, hyp,
@@ -39,6 +42,22 @@ def evaluate_wer(hyp: str, ref: Optional[str]) -> Optional[float]:
     except Exception:
         return None
 
+def word_errors(hyp: str, ref: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Returns (S + D + I, reference word count), for corpus WER = sum(errors) / sum(words)."""
+    if not ref:
+        return None
+    transformation = _wer_transform()
+    try:
+        out = jiwer.process_words(
+            ref, hyp,
+            reference_transform=transformation,
+            hypothesis_transform=transformation
+        )
+    except Exception:
+        return None
+    errors = out.substitutions + out.deletions + out.insertions
+    return errors, sum(len(r) for r in out.references)
+
 
 def run_vosk(audio_path: str, vosk_model_path: str, reference_text: Optional[str] = None) -> ASRBenchmarkResult:
     audio = load_audio_mono(audio_path, TARGET_SR)
@@ -0,0 +1,106 @@
+# src/keyword_index.py
+from __future__ import annotations
+import re
+from collections import deque
+from typing import Dict, Any, List, Iterable, Tuple, Optional
+
+_WORD_RE = re.compile(r"[\w']+")
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase and split into words, dropping punctuation (apostrophes inside words are kept)."""
+    words = (w.strip("'") for w in _WORD_RE.findall(text.lower()))
+    return [w for w in words if w]
+
+class KeywordIndex:
+    """
+    Aho-Corasick automaton over WORDS (not characters), so every keyword /
+    key phrase is found in a single left-to-right pass over a transcript,
+    regardless of how many keywords are indexed.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        # node 0 is the root; each node: goto dict, fail link, output keyword ids
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for kw in keywords:
+            self._add(kw)
+        self._build()
+
+    def _add(self, keyword: str):
+        words = normalize_words(keyword)
+        if not words:
+            return
+        phrase = " ".join(words)
+        if phrase in self.keywords:
+            return
+        kid = len(self.keywords)
+        self.keywords.append(phrase)
+        node = 0
+        for w in words:
+            nxt = self._goto[node].get(w)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][w] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(kid)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for w, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and w not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[child] = self._goto[f].get(w, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def _step(self, node: int, w: str) -> int:
+        while node and w not in self._goto[node]:
+            node = self._fail[node]
+        return self._goto[node].get(w, 0)
+
+    def search_words(self, words: List[str]) -> List[Tuple[str, int, int]]:
+        """Return (keyword, first_word_idx, last_word_idx) for every match, overlaps included."""
+        hits = []
+        node = 0
+        for i, w in enumerate(words):
+            node = self._step(node, w)
+            for kid in self._out[node]:
+                n = len(self.keywords[kid].split(" "))
+                hits.append((self.keywords[kid], i - n + 1, i))
+        return hits
+
+    def search(self, text: str) -> List[Dict[str, Any]]:
+        """Search a plain transcript. Returns dicts with 'keyword' and word positions."""
+        return [{"keyword": kw, "start_word": s, "end_word": e}
+                for kw, s, e in self.search_words(normalize_words(text))]
+
+    def search_segments(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Search ASR segments and attach timestamps.
+        Accepts Vosk word segments ({'word','start','end'}) and Whisper
+        segments ({'text','start','end'}); for Whisper, times are those of the
+        segment(s) containing the match. Matches may span segment boundaries.
+        """
+        words: List[str] = []
+        times: List[Tuple[Optional[float], Optional[float]]] = []
+        for seg in segments:
+            toks = normalize_words(seg.get("word") or seg.get("text") or "")
+            words.extend(toks)
+            times.extend([(seg.get("start"), seg.get("end"))] * len(toks))
+        return [{"keyword": kw, "start": times[s][0], "end": times[e][1]}
+                for kw, s, e in self.search_words(words)]
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Number of occurrences of each keyword in text (zeros included)."""
+        counts = {kw: 0 for kw in self.keywords}
+        for kw, _, _ in self.search_words(normalize_words(text)):
+            counts[kw] += 1
+        return counts
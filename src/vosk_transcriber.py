@@ -6,6 +6,9 @@ import numpy as np
 from typing import Optional, Dict, Any, List
 from vosk import Model, KaldiRecognizer
 from audio_utils import TARGET_SR, chunk_audio
+from keyword_index import KeywordIndex
+
+UNK = "[unk]"
 
 def _float_to_int16_pcm(audio: np.ndarray) -> bytes:
     audio = np.clip(audio, -1.0, 1.0)
@@ -17,9 +20,7 @@ class VoskTranscriber:
         self.model = Model(model_path)
         self.sample_rate = sample_rate
 
-    def transcribe(self, audio: np.ndarray, chunk_sec: float = 15.0) -> Dict[str, Any]:
-        """Returns dict with 'text' and 'segments' (word-level if available)."""
-        recognizer = KaldiRecognizer(self.model, self.sample_rate)
+    def _decode(self, recognizer: KaldiRecognizer, audio: np.ndarray, chunk_sec: float):
         recognizer.SetWords(True)
 
         full_text: List[str] = []
@@ -45,4 +46,31 @@ class VoskTranscriber:
                     segments_all.extend(partial["result"])
 
         text = " ".join(t.strip() for t in full_text if t.strip())
-        return {"engine": "vosk", "text": text.strip(), "segments": segments_all}
+        return text.strip(), segments_all
+
+    def transcribe(self, audio: np.ndarray, chunk_sec: float = 15.0) -> Dict[str, Any]:
+        """Returns dict with 'text' and 'segments' (word-level if available)."""
+        recognizer = KaldiRecognizer(self.model, self.sample_rate)
+        text, segments = self._decode(recognizer, audio, chunk_sec)
+        return {"engine": "vosk", "text": text, "segments": segments}
+
+    def spot_keywords(self, audio: np.ndarray, keywords: List[str], chunk_sec: float = 15.0) -> Dict[str, Any]:
+        """
+        Keyword spotting mode: decodes with a grammar restricted to the keywords
+        plus '[unk]', which is much faster than full large-vocabulary decoding.
+        Keywords must be in the model vocabulary (Vosk ignores unknown words).
+        Returns dict with 'text', 'segments' (recognized keyword words) and
+        'detections' ([{'keyword','start','end'}]).
+        """
+        index = KeywordIndex(keywords)
+        grammar = json.dumps(index.keywords + [UNK])
+        recognizer = KaldiRecognizer(self.model, self.sample_rate, grammar)
+        text, segments = self._decode(recognizer, audio, chunk_sec)
+        segments = [w for w in segments if w.get("word") != UNK]
+        text = " ".join(w for w in text.split() if w != UNK)
+        return {
+            "engine": "vosk-kws",
+            "text": text,
+            "segments": segments,
+            "detections": index.search_segments(segments)
+        }
@@ -1,29 +1,137 @@
 # src/whisper_transcriber.py
 from __future__ import annotations
-from typing import Dict, Any
+import hashlib
+import importlib
+import os
+from collections import OrderedDict
+from typing import Dict, Any, Optional
 import numpy as np
+import torch
 import whisper
 from audio_utils import TARGET_SR
 
 WHISPER_SIZES = ["tiny", "base", "small", "medium", "large"]
 
+# transcribe() looks log_mel_spectrogram up in its own module namespace
+_whisper_transcribe_mod = importlib.import_module("whisper.transcribe")
+
+def _array_key(data: np.ndarray) -> str:
+    data = np.ascontiguousarray(data)
+    h = hashlib.sha1(data.tobytes())
+    h.update(f"{data.dtype}{data.shape}".encode("utf-8"))
+    return h.hexdigest()
+
+class _LRUCache:
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._items: OrderedDict[str, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str):
+        value = self._items.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+class _CachedEncoder(torch.nn.Module):
+    """Wraps the Whisper AudioEncoder; identical mel windows are encoded only once."""
+
+    def __init__(self, encoder: torch.nn.Module, cache: _LRUCache, cache_dir: Optional[str] = None):
+        super().__init__()
+        self.encoder = encoder
+        self.cache = cache
+        self.cache_dir = cache_dir
+
+    def forward(self, mel: torch.Tensor) -> torch.Tensor:
+        key = _array_key(mel.detach().cpu().numpy())
+        out = self.cache.get(key)
+        if out is not None:
+            return out.to(mel.device)
+        path = os.path.join(self.cache_dir, key + ".pt") if self.cache_dir else None
+        if path and os.path.exists(path):
+            out = torch.load(path, map_location=mel.device)
+        else:
+            out = self.encoder(mel)
+            if path:
+                torch.save(out.cpu(), path)
+        self.cache.put(key, out)
+        return out
+
 class WhisperTranscriber:
-    def __init__(self, model_size: str = "small", device: str | None = None, compute_type: str | None = None):
+    def __init__(self, model_size: str = "small", device: str | None = None, compute_type: str | None = None,
+                 cache_size: int = 0, cache_dir: str | None = None):
         """
         model_size: one of WHISPER_SIZES
         device: 'cuda' or 'cpu' (auto if None)
         compute_type: ignored by openai-whisper; kept for future compatibility
+        cache_size: if > 0, keep log-mel features and encoder outputs of the last
+                    cache_size audios/windows in memory (LRU) and reuse them across
+                    decode settings; only the decoder runs again
+        cache_dir: optional directory where encoder outputs are also written to
+                   disk (one .pt per 30 s window) and looked up on memory misses
         """
         assert model_size in WHISPER_SIZES, f"model_size must be one of {WHISPER_SIZES}"
         self.model = whisper.load_model(model_size, device=device)
+        self.mel_cache: Optional[_LRUCache] = None
+        self.encoder_cache: Optional[_LRUCache] = None
+        if cache_size > 0:
+            self.mel_cache = _LRUCache(cache_size)
+            self.encoder_cache = _LRUCache(cache_size)
+            if cache_dir:
+                cache_dir = os.path.join(cache_dir, model_size)
+                os.makedirs(cache_dir, exist_ok=True)
+            self._encoder = self.model.encoder
+            self._cached_encoder = _CachedEncoder(self._encoder, self.encoder_cache, cache_dir)
+
+    def _cached_log_mel(self, audio, n_mels: int = 80, padding: int = 0, device=None):
+        if not isinstance(audio, np.ndarray):
+            return whisper.log_mel_spectrogram(audio, n_mels, padding=padding, device=device)
+        key = f"{_array_key(audio)}:{n_mels}:{padding}"
+        mel = self.mel_cache.get(key)
+        if mel is None:
+            mel = whisper.log_mel_spectrogram(audio, n_mels, padding=padding, device=device)
+            self.mel_cache.put(key, mel)
+        return mel
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters of the mel and encoder caches (empty if caching is off)."""
+        if self.mel_cache is None:
+            return {}
+        return {
+            "mel_hits": self.mel_cache.hits, "mel_misses": self.mel_cache.misses,
+            "encoder_hits": self.encoder_cache.hits, "encoder_misses": self.encoder_cache.misses,
+        }
 
-    def transcribe(self, audio: np.ndarray, language: str | None = None, task: str = "transcribe") -> Dict[str, Any]:
+    def transcribe(self, audio: np.ndarray, language: str | None = None, task: str = "transcribe",
+                   **decode_options) -> Dict[str, Any]:
         """
         language: 'pt', 'en', etc. If None, Whisper will detect.
         task: 'transcribe' or 'translate'
+        decode_options: extra whisper options (beam_size, best_of, temperature, ...)
         """
+        decode_options.setdefault("fp16", False)
         # Whisper expects float32 16000 mono in numpy, that's okay
-        result = self.model.transcribe(audio, language=language, task=task, fp16=False)
+        if self.mel_cache is None:
+            result = self.model.transcribe(audio, language=language, task=task, **decode_options)
+        else:
+            # swap in the cached mel/encoder only for this call
+            self.model.encoder = self._cached_encoder
+            _whisper_transcribe_mod.log_mel_spectrogram = self._cached_log_mel
+            try:
+                result = self.model.transcribe(audio, language=language, task=task, **decode_options)
+            finally:
+                self.model.encoder = self._encoder
+                _whisper_transcribe_mod.log_mel_spectrogram = whisper.log_mel_spectrogram
         # Normalize output similar to Vosk
         segments = []
         for seg in result.get("segments", []):